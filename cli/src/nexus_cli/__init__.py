@@ -2,14 +2,49 @@
 
 __version__ = "1.0.0"
 
-from .analyzer import NexusAnalyzer, AnalysisResult, StateResult, Transaction
-from .config_loader import ConfigLoader, get_loader
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .analyzer import (
+        AnalysisResult,
+        NexusAnalyzer,
+        StateResult,
+        Transaction,
+        TransactionBatch,
+    )
+    from .config_loader import ConfigLoader, get_loader
 
 __all__ = [
     "NexusAnalyzer",
     "AnalysisResult",
     "StateResult",
     "Transaction",
+    "TransactionBatch",
     "ConfigLoader",
     "get_loader",
 ]
+
+# Which submodule provides each re-exported name. Resolved lazily so that
+# `nexus --help` doesn't pay the pandas/pydantic import cost up front.
+_SUBMODULE_BY_NAME = {
+    "NexusAnalyzer": "analyzer",
+    "AnalysisResult": "analyzer",
+    "StateResult": "analyzer",
+    "Transaction": "analyzer",
+    "TransactionBatch": "analyzer",
+    "ConfigLoader": "config_loader",
+    "get_loader": "config_loader",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import re-exported names from their submodules on first access."""
+    submodule = _SUBMODULE_BY_NAME.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(f".{submodule}", __name__), name)
+    globals()[name] = value
+    return value
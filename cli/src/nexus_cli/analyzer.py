@@ -4,16 +4,140 @@ This module implements nexus detection logic that mirrors the
 TypeScript implementation in the web app.
 """
 
+import io
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 import pandas as pd
 from dataclasses import dataclass
-from datetime import date, datetime
+from datetime import date
 from pathlib import Path
-from typing import List, Optional
-
-from .config_loader import get_loader, StateRule
-
-
-@dataclass
+from typing import Iterable, Iterator, List, Optional, Union
+
+from .config_loader import US_STATES, get_loader, StateRule
+
+
+# Full state name -> 2-letter code, built once at import
+_STATE_NAME_TO_CODE = {
+    "ALABAMA": "AL",
+    "ALASKA": "AK",
+    "ARIZONA": "AZ",
+    "ARKANSAS": "AR",
+    "CALIFORNIA": "CA",
+    "COLORADO": "CO",
+    "CONNECTICUT": "CT",
+    "DELAWARE": "DE",
+    "FLORIDA": "FL",
+    "GEORGIA": "GA",
+    "HAWAII": "HI",
+    "IDAHO": "ID",
+    "ILLINOIS": "IL",
+    "INDIANA": "IN",
+    "IOWA": "IA",
+    "KANSAS": "KS",
+    "KENTUCKY": "KY",
+    "LOUISIANA": "LA",
+    "MAINE": "ME",
+    "MARYLAND": "MD",
+    "MASSACHUSETTS": "MA",
+    "MICHIGAN": "MI",
+    "MINNESOTA": "MN",
+    "MISSISSIPPI": "MS",
+    "MISSOURI": "MO",
+    "MONTANA": "MT",
+    "NEBRASKA": "NE",
+    "NEVADA": "NV",
+    "NEW HAMPSHIRE": "NH",
+    "NEW JERSEY": "NJ",
+    "NEW MEXICO": "NM",
+    "NEW YORK": "NY",
+    "NORTH CAROLINA": "NC",
+    "NORTH DAKOTA": "ND",
+    "OHIO": "OH",
+    "OKLAHOMA": "OK",
+    "OREGON": "OR",
+    "PENNSYLVANIA": "PA",
+    "RHODE ISLAND": "RI",
+    "SOUTH CAROLINA": "SC",
+    "SOUTH DAKOTA": "SD",
+    "TENNESSEE": "TN",
+    "TEXAS": "TX",
+    "UTAH": "UT",
+    "VERMONT": "VT",
+    "VIRGINIA": "VA",
+    "WASHINGTON": "WA",
+    "WEST VIRGINIA": "WV",
+    "WISCONSIN": "WI",
+    "WYOMING": "WY",
+    "DISTRICT OF COLUMBIA": "DC",
+}
+
+# The 51 valid jurisdiction codes (50 states + DC), shared with the loader
+_VALID_STATES = US_STATES
+
+# pyarrow is optional: when installed, parsed CSVs are cached as Parquet
+# sidecar files for much faster repeat loads
+try:
+    import pyarrow  # noqa: F401
+
+    _HAVE_PARQUET = True
+except ImportError:
+    _HAVE_PARQUET = False
+
+# numba is optional: when installed, the breach scan is JIT-compiled into
+# a single fused loop; otherwise a NumPy implementation is used
+try:
+    from numba import njit as _njit
+except ImportError:
+    _njit = None
+
+
+def _breach_scan_numpy(amounts: np.ndarray, threshold: float, txn_idx: int) -> tuple:
+    """Scan the running sum for the revenue-threshold crossing.
+
+    Returns (total, rev_cross, pre_rev, pre_txn): the period total, the
+    first index where the running sum meets ``threshold`` (-1 if never),
+    and the prefix sums just before that crossing and before ``txn_idx``,
+    so the caller never needs a second partial-sum pass.
+    """
+    n = amounts.shape[0]
+    if n == 0:
+        return 0.0, -1, 0.0, 0.0
+    cum = np.cumsum(amounts)
+    mask = cum >= threshold
+    rev_cross = int(np.argmax(mask)) if mask.any() else -1
+    pre_rev = float(cum[rev_cross - 1]) if rev_cross > 0 else 0.0
+    pre_txn = float(cum[txn_idx - 1]) if 0 < txn_idx <= n else 0.0
+    return float(cum[-1]), rev_cross, pre_rev, pre_txn
+
+
+if _njit is not None:
+
+    @_njit(cache=True)
+    def _breach_scan(
+        amounts: np.ndarray, threshold: float, txn_idx: int
+    ) -> tuple:  # pragma: no cover - exercised when numba present
+        total = 0.0
+        rev_cross = -1
+        pre_rev = 0.0
+        pre_txn = 0.0
+        for i in range(amounts.shape[0]):
+            if i == txn_idx:
+                pre_txn = total
+            new_total = total + amounts[i]
+            if rev_cross < 0 and new_total >= threshold:
+                rev_cross = i
+                pre_rev = total
+            total = new_total
+        return total, rev_cross, pre_rev, pre_txn
+
+else:
+    _breach_scan = _breach_scan_numpy
+
+
+@dataclass(slots=True, frozen=True)
 class Transaction:
     """A single transaction record."""
 
@@ -24,7 +148,68 @@ class Transaction:
     revenue_type: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
+class TransactionBatch:
+    """Transactions stored as parallel column arrays (struct-of-arrays).
+
+    Holds one NumPy array per field instead of one Python object per row,
+    which cuts memory by an order of magnitude and lets the analysis
+    operate on whole columns at once.
+    """
+
+    ids: np.ndarray  # object (str)
+    states: pd.Categorical  # state codes as int codes over observed categories
+    amounts: np.ndarray  # float64
+    dates: np.ndarray  # datetime64[D]
+    revenue_types: np.ndarray  # object (str or None)
+
+    def __len__(self) -> int:
+        return len(self.amounts)
+
+    def take(self, indexer: np.ndarray) -> "TransactionBatch":
+        """Return a new batch with the rows selected by a mask or index array."""
+        return TransactionBatch(
+            ids=self.ids[indexer],
+            states=self.states[indexer],
+            amounts=self.amounts[indexer],
+            dates=self.dates[indexer],
+            revenue_types=self.revenue_types[indexer],
+        )
+
+    def slice(self, start: int, end: int) -> "TransactionBatch":
+        """Return rows [start:end) as views, without copying the columns."""
+        return TransactionBatch(
+            ids=self.ids[start:end],
+            states=self.states[start:end],
+            amounts=self.amounts[start:end],
+            dates=self.dates[start:end],
+            revenue_types=self.revenue_types[start:end],
+        )
+
+    @classmethod
+    def from_transactions(cls, transactions: List[Transaction]) -> "TransactionBatch":
+        """Build a batch from a list of Transaction objects."""
+        return cls(
+            ids=np.array([t.id for t in transactions], dtype=object),
+            states=pd.Categorical([t.state_code for t in transactions]),
+            amounts=np.array([t.amount for t in transactions], dtype=np.float64),
+            dates=np.array([t.date for t in transactions], dtype="datetime64[D]"),
+            revenue_types=np.array([t.revenue_type for t in transactions], dtype=object),
+        )
+
+    @classmethod
+    def concat(cls, batches: List["TransactionBatch"]) -> "TransactionBatch":
+        """Concatenate several batches into one."""
+        return cls(
+            ids=np.concatenate([b.ids for b in batches]),
+            states=pd.api.types.union_categoricals([b.states for b in batches]),
+            amounts=np.concatenate([b.amounts for b in batches]),
+            dates=np.concatenate([b.dates for b in batches]),
+            revenue_types=np.concatenate([b.revenue_types for b in batches]),
+        )
+
+
+@dataclass(slots=True)
 class StateResult:
     """Nexus analysis result for a single state."""
 
@@ -42,7 +227,7 @@ class StateResult:
     estimated_liability: float
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """Complete analysis result for all states."""
 
@@ -53,6 +238,99 @@ class AnalysisResult:
     warnings: List[str]
 
 
+def _analyze_state_batch(
+    state_code: str, batch: TransactionBatch, rule: StateRule, tax_rate: float
+) -> StateResult:
+    """Analyze a single state's transaction batch.
+
+    The batch must already be sorted by (date, id), as produced by
+    _group_by_state.
+    """
+    amounts = batch.amounts
+    dates = batch.dates
+    ids = batch.ids
+
+    # Scan the running sum once for the total and the first crossing
+    n = len(amounts)
+    total_txns = n
+    breach_idx = -1
+    breach_type = None
+
+    # No threshold = no breach possible (states without sales tax)
+    pre_breach_revenue = 0.0
+    if rule.amount > 0 and n:
+        if rule.transactions and n >= rule.transactions:
+            txn_breach = rule.transactions - 1
+        else:
+            txn_breach = n
+
+        total_revenue, rev_cross, pre_rev, pre_txn = _breach_scan(
+            amounts, rule.amount, txn_breach
+        )
+
+        # A threshold counts as breached only if the period-end net
+        # total still meets it (refunds can undo a mid-year crossing,
+        # per the shared test cases); the breach date stays at the
+        # first crossing of the running sum.
+        if rev_cross >= 0 and total_revenue >= rule.amount:
+            rev_breach = rev_cross
+        else:
+            rev_breach = n
+
+        if min(rev_breach, txn_breach) < n:
+            if rev_breach <= txn_breach:
+                breach_idx = rev_breach
+                breach_type = "revenue"
+                pre_breach_revenue = pre_rev
+            else:
+                breach_idx = txn_breach
+                breach_type = "transactions"
+                pre_breach_revenue = pre_txn
+    else:
+        total_revenue = float(amounts.sum()) if n else 0.0
+
+    # Calculate threshold percentage
+    if rule.amount > 0:
+        revenue_pct = (total_revenue / rule.amount) * 100
+        txn_pct = 0.0
+        if rule.transactions and rule.transactions > 0:
+            txn_pct = (total_txns / rule.transactions) * 100
+        threshold_pct = max(revenue_pct, txn_pct)
+    else:
+        threshold_pct = 0.0
+
+    # Calculate liability (simple estimate: total_revenue * tax_rate)
+    liability = 0.0
+    if breach_idx >= 0:
+        # Only liable for post-nexus revenue
+        post_nexus_revenue = total_revenue - pre_breach_revenue
+        liability = post_nexus_revenue * (tax_rate / 100)
+
+    return StateResult(
+        state_code=state_code,
+        has_nexus=breach_idx >= 0,
+        total_revenue=float(total_revenue),
+        total_transactions=total_txns,
+        threshold_revenue=rule.amount,
+        threshold_transactions=rule.transactions,
+        breach_type=breach_type,
+        breach_date=dates[breach_idx].item() if breach_idx >= 0 else None,
+        breach_transaction_id=ids[breach_idx] if breach_idx >= 0 else None,
+        threshold_percentage=threshold_pct,
+        tax_rate=tax_rate,
+        estimated_liability=liability,
+    )
+
+
+# Per-state analysis moves to a process pool above this many filtered rows
+_PARALLEL_MIN_ROWS = 100_000
+
+
+def _analyze_state_task(args: tuple) -> StateResult:
+    """Unpack a (state_code, batch, rule, tax_rate) tuple for executor.map."""
+    return _analyze_state_batch(*args)
+
+
 class NexusAnalyzer:
     """Analyzes transaction data for nexus obligations."""
 
@@ -60,11 +338,22 @@ class NexusAnalyzer:
         """Initialize the analyzer with configuration."""
         self.loader = get_loader()
 
-    def load_csv(self, file_path: Path) -> List[Transaction]:
+    def load_csv(
+        self, file_path: Path, use_cache: bool = True, year: Optional[int] = None
+    ) -> List[Transaction]:
         """Load transactions from a CSV file.
 
+        When pyarrow is installed, the parsed frame is cached as a
+        ``.parquet`` sidecar next to the source file; repeat loads read the
+        sidecar instead of re-parsing the CSV as long as it is newer than
+        the source.
+
         Args:
             file_path: Path to the CSV file
+            use_cache: Whether to read/write the Parquet sidecar cache
+            year: If given, drop rows outside this year at load time so
+                off-year rows never pay object-construction cost. On cache
+                hits the filter is pushed into the Parquet scan.
 
         Returns:
             List of Transaction objects
@@ -72,67 +361,245 @@ class NexusAnalyzer:
         Raises:
             ValueError: If required columns are missing or data is invalid
         """
+        cache_path = file_path.with_suffix(".parquet")
+
+        if (
+            use_cache
+            and _HAVE_PARQUET
+            and cache_path.exists()
+            and cache_path.stat().st_mtime >= file_path.stat().st_mtime
+        ):
+            try:
+                filters = None
+                if year is not None:
+                    filters = [
+                        ("date", ">=", pd.Timestamp(year, 1, 1)),
+                        ("date", "<", pd.Timestamp(year + 1, 1, 1)),
+                    ]
+                return self._frame_to_transactions(
+                    pd.read_parquet(cache_path, filters=filters)
+                )
+            except Exception:
+                # Unreadable/stale sidecar: fall through to the CSV parse
+                pass
+
+        usecols, dtypes, date_col, rename_map = self._resolve_csv_columns(file_path)
+
+        # With a target year, drop off-year lines at the byte level so the
+        # parser never sees them. The prefilter declines (returns None) for
+        # files without ISO dates; those go through the full parse and the
+        # typed year filter instead.
+        source: Union[Path, io.BytesIO] = file_path
+        if year is not None:
+            prefiltered = self._prefilter_year_bytes(file_path, year)
+            if prefiltered is not None:
+                source = prefiltered
+
         try:
-            df = pd.read_csv(file_path)
+            df = pd.read_csv(
+                source,
+                usecols=usecols,
+                dtype=dtypes,
+                parse_dates=[date_col],
+                engine="c",
+            )
         except Exception as e:
             raise ValueError(f"Failed to read CSV file: {e}")
 
-        # Check required columns
-        required_cols = ["date", "state", "amount"]
-        missing_cols = [col for col in required_cols if col not in df.columns]
-        if missing_cols:
-            # Try alternative column names
-            col_mapping = {
-                "date": ["transaction_date", "sale_date", "order_date"],
-                "state": ["state_code", "State", "STATE"],
-                "amount": ["sale_amount", "sales_amount", "revenue", "total"],
-            }
-
-            for col in missing_cols:
-                found = False
-                for alt_name in col_mapping.get(col, []):
-                    if alt_name in df.columns:
-                        df.rename(columns={alt_name: col}, inplace=True)
-                        found = True
-                        break
-
-                if not found:
-                    raise ValueError(f"Missing required column: {col}")
-
-        # Convert to transactions
-        transactions = []
-        for idx, row in df.iterrows():
+        if rename_map:
+            df.rename(columns=rename_map, inplace=True)
+
+        # Only cache complete (unfiltered) frames in the sidecar
+        if use_cache and _HAVE_PARQUET and year is None:
             try:
-                # Parse date
-                if isinstance(row["date"], str):
-                    txn_date = datetime.strptime(row["date"], "%Y-%m-%d").date()
-                else:
-                    txn_date = pd.to_datetime(row["date"]).date()
-
-                # Parse state code
-                state_code = str(row["state"]).strip().upper()
-                if len(state_code) > 2:
-                    # Might be full state name, try to map it
-                    state_code = self._map_state_name(state_code)
-
-                # Parse amount
-                amount = float(row["amount"])
-
-                # Create transaction
-                txn = Transaction(
-                    id=str(row.get("id", f"tx-{idx}")),
-                    state_code=state_code,
-                    amount=amount,
-                    date=txn_date,
-                    revenue_type=row.get("revenue_type"),
+                df.to_parquet(cache_path, compression="zstd")
+            except Exception:
+                # Caching is best-effort (e.g. read-only directories)
+                pass
+
+        return self._frame_to_transactions(self._apply_year_filter(df, year))
+
+    @staticmethod
+    def _prefilter_year_bytes(file_path: Path, year: int) -> Optional[io.BytesIO]:
+        """Drop raw CSV lines that cannot belong to the target year.
+
+        Scans the file bytes for the year token before any parsing, so
+        off-year lines never reach the CSV parser at all. Lines are kept
+        whenever the token appears anywhere (an over-approximation; the
+        typed year filter after parsing removes false keeps), so no
+        target-year row is ever lost — provided dates carry a literal
+        4-digit year. Files using other date formats (e.g. 06/15/24)
+        would lose rows wholesale, so the first data line is sniffed for
+        an ISO-style date and the prefilter returns None when it finds
+        none, letting the caller fall back to the full parse. Assumes one
+        record per line, i.e. no embedded newlines inside quoted fields.
+        """
+        token = str(year).encode()
+        buf = bytearray()
+        with open(file_path, "rb") as f:
+            header = f.readline()
+            first = f.readline()
+            if first and not re.search(rb"\b\d{4}-\d{2}-\d{2}\b", first):
+                return None
+
+            buf += header  # always keep the header
+            if token in first:
+                buf += first
+            for line in f:
+                if token in line:
+                    buf += line
+        return io.BytesIO(bytes(buf))
+
+    @staticmethod
+    def _apply_year_filter(df: pd.DataFrame, year: Optional[int]) -> pd.DataFrame:
+        """Drop rows outside the given year when the date column is typed.
+
+        Untyped date columns are left alone so _frame_to_transactions can
+        report the bad rows instead of silently dropping them.
+        """
+        if year is None or not pd.api.types.is_datetime64_any_dtype(df["date"]):
+            return df
+        return df[df["date"].dt.year == year]
+
+    def iter_csv(
+        self, file_path: Path, chunksize: int = 500_000, year: Optional[int] = None
+    ) -> Iterator[List[Transaction]]:
+        """Stream transactions from a CSV file in chunks.
+
+        Reads the file with ``read_csv(chunksize=...)`` so peak memory is
+        bounded by the chunk size rather than the file size. Use together
+        with :meth:`analyze_stream` for files too large to hold in memory.
+
+        Args:
+            file_path: Path to the CSV file
+            chunksize: Number of rows to read per chunk
+            year: If given, drop rows outside this year per chunk
+
+        Yields:
+            Lists of Transaction objects, one list per chunk
+
+        Raises:
+            ValueError: If required columns are missing or data is invalid
+        """
+        usecols, dtypes, date_col, rename_map = self._resolve_csv_columns(file_path)
+
+        offset = 0
+        try:
+            reader = pd.read_csv(
+                file_path,
+                usecols=usecols,
+                dtype=dtypes,
+                parse_dates=[date_col],
+                engine="c",
+                chunksize=chunksize,
+            )
+        except Exception as e:
+            raise ValueError(f"Failed to read CSV file: {e}")
+
+        with reader:
+            for chunk in reader:
+                if rename_map:
+                    chunk.rename(columns=rename_map, inplace=True)
+                yield self._frame_to_transactions(
+                    self._apply_year_filter(chunk, year), id_offset=offset
                 )
+                offset += len(chunk)
+
+    def _resolve_csv_columns(
+        self, file_path: Path
+    ) -> tuple[list[str], dict[str, str], str, dict[str, str]]:
+        """Resolve CSV column names and dtypes from a header-only read.
+
+        Returns:
+            Tuple of (usecols, dtypes, date_col, rename_map) for read_csv.
+
+        Raises:
+            ValueError: If a required column is missing.
+        """
+        # Cheap header-only read to resolve column names before the full parse
+        try:
+            header_cols = list(pd.read_csv(file_path, nrows=0).columns)
+        except Exception as e:
+            raise ValueError(f"Failed to read CSV file: {e}")
+
+        # Map alternative column names onto the canonical ones
+        col_mapping = {
+            "date": ["transaction_date", "sale_date", "order_date"],
+            "state": ["state_code", "State", "STATE"],
+            "amount": ["sale_amount", "sales_amount", "revenue", "total"],
+        }
+
+        rename_map = {}
+        for col in ["date", "state", "amount"]:
+            if col in header_cols:
+                continue
+            for alt_name in col_mapping.get(col, []):
+                if alt_name in header_cols:
+                    rename_map[alt_name] = col
+                    break
+            else:
+                raise ValueError(f"Missing required column: {col}")
+
+        # Read only the columns we use, with explicit dtypes so the C parser
+        # skips dtype inference and never builds object columns
+        wanted = {"id", "date", "state", "amount", "revenue_type"}
+        usecols = [c for c in header_cols if rename_map.get(c, c) in wanted]
+        target_dtypes = {"id": "string", "state": "string", "revenue_type": "category"}
+        dtypes = {
+            c: target_dtypes[rename_map.get(c, c)]
+            for c in usecols
+            if rename_map.get(c, c) in target_dtypes
+        }
+        date_col = next(c for c in usecols if rename_map.get(c, c) == "date")
+
+        return usecols, dtypes, date_col, rename_map
+
+    def _frame_to_transactions(self, df: pd.DataFrame, id_offset: int = 0) -> List[Transaction]:
+        """Convert a normalized DataFrame into Transaction objects.
 
-                transactions.append(txn)
+        Args:
+            df: DataFrame with canonical column names
+            id_offset: Row-number offset for generated ids when streaming
+
+        Raises:
+            ValueError: If a date or amount cannot be parsed.
+        """
+        # Convert columns to their target types in bulk instead of per row
+        dates = pd.to_datetime(df["date"], format="%Y-%m-%d", errors="coerce", cache=True)
+        if dates.isna().any():
+            idx = dates.index[dates.isna()][0]
+            raise ValueError(f"Error parsing row {idx}: invalid date {df['date'][idx]!r}")
+
+        states = df["state"].astype(str).str.strip().str.upper()
+        long_names = states.str.len() > 2
+        if long_names.any():
+            # Might be full state names, map them through the module dict
+            states = states.copy()
+            states[long_names] = (
+                states[long_names].map(_STATE_NAME_TO_CODE).fillna(states[long_names].str[:2])
+            )
 
-            except Exception as e:
-                raise ValueError(f"Error parsing row {idx}: {e}")
+        amounts = pd.to_numeric(df["amount"], errors="coerce")
+        if amounts.isna().any():
+            idx = amounts.index[amounts.isna()][0]
+            raise ValueError(f"Error parsing row {idx}: invalid amount {df['amount'][idx]!r}")
 
-        return transactions
+        if "id" in df.columns:
+            ids = df["id"].astype(str)
+        else:
+            ids = pd.Series(
+                [f"tx-{i}" for i in range(id_offset, id_offset + len(df))], index=df.index
+            )
+
+        if "revenue_type" in df.columns:
+            revenue_types = df["revenue_type"].astype(object).where(df["revenue_type"].notna(), None)
+        else:
+            revenue_types = pd.Series([None] * len(df), index=df.index, dtype=object)
+
+        return [
+            Transaction(id=i, state_code=s, amount=a, date=d, revenue_type=r)
+            for i, s, a, d, r in zip(ids, states, amounts, dates.dt.date, revenue_types)
+        ]
 
     def analyze(
         self,
@@ -157,32 +624,143 @@ class NexusAnalyzer:
 
         warnings = []
 
+        batch = (
+            transactions
+            if isinstance(transactions, TransactionBatch)
+            else TransactionBatch.from_transactions(transactions)
+        )
+
         # Filter transactions
         filtered = self._filter_transactions(
-            transactions, year, ignore_marketplace, include_negatives, warnings
+            batch, year, ignore_marketplace, include_negatives, warnings
         )
 
+        if ignore_marketplace:
+            filtered_count = len(batch) - len(filtered)
+            if filtered_count > 0:
+                warnings.append(f"Filtered out {filtered_count} marketplace transactions")
+
         # Group by state
         by_state = self._group_by_state(filtered)
 
-        # Analyze each state
-        state_results = []
+        state_results, total_liability = self._build_state_results(by_state, warnings)
+
+        return AnalysisResult(
+            state_results=state_results,
+            total_liability=total_liability,
+            analysis_year=year,
+            transaction_count=len(filtered),
+            warnings=warnings,
+        )
+
+    def analyze_stream(
+        self,
+        chunks: Iterable[Union[List[Transaction], TransactionBatch]],
+        year: Optional[int] = None,
+        ignore_marketplace: bool = False,
+        include_negatives: bool = False,
+    ) -> AnalysisResult:
+        """Analyze a stream of transaction chunks for nexus.
+
+        Consumes the generator produced by :meth:`iter_csv`, filtering and
+        grouping chunk by chunk so the full transaction list is never
+        materialized in memory.
+
+        Args:
+            chunks: Iterable of transaction lists (e.g. from iter_csv)
+            year: Year to analyze (default: current year)
+            ignore_marketplace: Whether to ignore marketplace transactions
+            include_negatives: Whether to include negative amounts
+
+        Returns:
+            AnalysisResult with findings for each state
+        """
+        if year is None:
+            year = date.today().year
+
+        warnings: List[str] = []
+        partials: dict[str, List[TransactionBatch]] = {}
+        total_seen = 0
+        total_kept = 0
+
+        for chunk in chunks:
+            chunk_batch = (
+                chunk
+                if isinstance(chunk, TransactionBatch)
+                else TransactionBatch.from_transactions(chunk)
+            )
+            total_seen += len(chunk_batch)
+            filtered = self._filter_transactions(
+                chunk_batch, year, ignore_marketplace, include_negatives, warnings
+            )
+            total_kept += len(filtered)
+            for state_code, state_batch in self._group_by_state(filtered).items():
+                partials.setdefault(state_code, []).append(state_batch)
+
+        if ignore_marketplace:
+            filtered_count = total_seen - total_kept
+            if filtered_count > 0:
+                warnings.append(f"Filtered out {filtered_count} marketplace transactions")
+
+        # Chunks arrive in file order, so re-sort each state's merged batch
+        # by (date, id) to restore the ordering _analyze_state expects
+        by_state = {}
+        for state_code, batches in partials.items():
+            merged = TransactionBatch.concat(batches)
+            order = np.lexsort((merged.ids, merged.dates))
+            by_state[state_code] = merged.take(order)
+
+        state_results, total_liability = self._build_state_results(by_state, warnings)
+
+        return AnalysisResult(
+            state_results=state_results,
+            total_liability=total_liability,
+            analysis_year=year,
+            transaction_count=total_kept,
+            warnings=warnings,
+        )
+
+    def _build_state_results(
+        self, by_state: dict, warnings: List[str]
+    ) -> tuple:
+        """Analyze each state's transactions and fill in no-activity states.
+
+        Returns:
+            Tuple of (state_results, total_liability).
+        """
+        # Prefetch the rule and rate tables once instead of per-state
+        # loader calls
+        rules_by_state = {r.state_code: r for r in self.loader.get_current_rules()}
+        rates = self.loader.load_tax_rates().rates
+
+        def tax_rate_for(state_code: str) -> float:
+            rate_info = rates.get(state_code)
+            return rate_info.combined_rate if rate_info else 0.0
+
+        tasks = []
         for state_code, state_txns in by_state.items():
-            rule = self.loader.get_rule_for_state(state_code)
+            rule = rules_by_state.get(state_code)
             if rule is None:
                 warnings.append(f"No rule found for state: {state_code}")
                 continue
 
-            result = self._analyze_state(state_code, state_txns, rule)
-            state_results.append(result)
+            tasks.append((state_code, state_txns, rule, tax_rate_for(state_code)))
+
+        # Spread heavy workloads across processes; below the threshold the
+        # pool's startup and pickling costs outweigh the win
+        total_rows = sum(len(task[1]) for task in tasks)
+        if total_rows > _PARALLEL_MIN_ROWS and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+                state_results = list(pool.map(_analyze_state_task, tasks))
+        else:
+            state_results = [_analyze_state_task(task) for task in tasks]
 
         # Add states with no transactions
-        all_rules = self.loader.get_current_rules()
         processed_states = {r.state_code for r in state_results}
 
-        for rule in all_rules:
+        for rule in rules_by_state.values():
             if rule.state_code not in processed_states:
-                tax_rate = self.loader.get_tax_rate(rule.state_code) or 0.0
+                tax_rate = tax_rate_for(rule.state_code)
                 state_results.append(
                     StateResult(
                         state_code=rule.state_code,
@@ -203,13 +781,7 @@ class NexusAnalyzer:
         # Calculate total liability
         total_liability = sum(r.estimated_liability for r in state_results)
 
-        return AnalysisResult(
-            state_results=state_results,
-            total_liability=total_liability,
-            analysis_year=year,
-            transaction_count=len(filtered),
-            warnings=warnings,
-        )
+        return state_results, total_liability
 
     def export_excel(self, result: AnalysisResult, output_path: Path) -> None:
         """Export analysis results to Excel.
@@ -264,234 +836,141 @@ class NexusAnalyzer:
             "Est. Liability",
         ]
 
-        for col, header in enumerate(headers, start=1):
-            cell = ws_detail.cell(row=1, column=col, value=header)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            cell.font = Font(color="FFFFFF", bold=True)
+        # Style the header row once instead of per-cell font reassignment
+        ws_detail.append(headers)
+        header_font = Font(color="FFFFFF", bold=True)
+        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+        for cell in ws_detail[1]:
+            cell.font = header_font
+            cell.fill = header_fill
 
-        # Add nexus states
-        row = 2
+        # Add nexus states as whole appended rows
         for state in sorted(
             [r for r in result.state_results if r.has_nexus],
             key=lambda x: x.total_revenue,
             reverse=True,
         ):
-            ws_detail.cell(row=row, column=1, value=state.state_code)
-            ws_detail.cell(row=row, column=2, value=state.total_revenue).number_format = "$#,##0.00"
-            ws_detail.cell(row=row, column=3, value=state.threshold_revenue).number_format = (
-                "$#,##0.00"
-            )
-            ws_detail.cell(row=row, column=4, value=state.threshold_percentage / 100).number_format = (
-                "0.0%"
-            )
-            ws_detail.cell(row=row, column=5, value=state.total_transactions)
-            ws_detail.cell(row=row, column=6, value=state.breach_type or "")
-            ws_detail.cell(
-                row=row,
-                column=7,
-                value=state.breach_date.strftime("%Y-%m-%d") if state.breach_date else "",
-            )
-            ws_detail.cell(row=row, column=8, value=state.tax_rate / 100).number_format = "0.00%"
-            ws_detail.cell(row=row, column=9, value=state.estimated_liability).number_format = (
-                "$#,##0.00"
+            ws_detail.append(
+                (
+                    state.state_code,
+                    state.total_revenue,
+                    state.threshold_revenue,
+                    state.threshold_percentage / 100,
+                    state.total_transactions,
+                    state.breach_type or "",
+                    state.breach_date.strftime("%Y-%m-%d") if state.breach_date else "",
+                    state.tax_rate / 100,
+                    state.estimated_liability,
+                )
             )
-            row += 1
 
-        # Auto-size columns
+        # Apply number formats column-wise
+        column_formats = {2: "$#,##0.00", 3: "$#,##0.00", 4: "0.0%", 8: "0.00%", 9: "$#,##0.00"}
+        if ws_detail.max_row > 1:
+            for col_idx, fmt in column_formats.items():
+                for (cell,) in ws_detail.iter_rows(
+                    min_row=2, min_col=col_idx, max_col=col_idx
+                ):
+                    cell.number_format = fmt
+
+        # Auto-size columns in a single pass over the cell values
+        from openpyxl.utils import get_column_letter
+
         for ws in [ws_summary, ws_detail]:
-            for column in ws.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(cell.value)
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                ws.column_dimensions[column_letter].width = adjusted_width
+            col_widths: dict[int, int] = {}
+            for row_values in ws.iter_rows(values_only=True):
+                for col_idx, value in enumerate(row_values, start=1):
+                    if value is None:
+                        continue
+                    length = len(str(value))
+                    if length > col_widths.get(col_idx, 0):
+                        col_widths[col_idx] = length
+            for col_idx, width in col_widths.items():
+                ws.column_dimensions[get_column_letter(col_idx)].width = min(width + 2, 50)
 
         # Save
         wb.save(output_path)
 
     def _filter_transactions(
         self,
-        transactions: List[Transaction],
+        batch: TransactionBatch,
         year: int,
         ignore_marketplace: bool,
         include_negatives: bool,
         warnings: List[str],
-    ) -> List[Transaction]:
-        """Filter transactions based on options."""
-        filtered = []
-
-        for txn in transactions:
-            # Filter by year
-            if txn.date.year != year:
-                continue
-
-            # Filter marketplace
-            if ignore_marketplace and txn.revenue_type == "marketplace":
-                continue
-
-            # Filter negatives
-            if not include_negatives and txn.amount < 0:
-                continue
-
-            # Validate state code
-            if not self._is_valid_state_code(txn.state_code):
-                warnings.append(f"Invalid state code: {txn.state_code}")
-                continue
-
-            filtered.append(txn)
+    ) -> TransactionBatch:
+        """Filter a transaction batch with vectorized boolean masks."""
+        # Filter by year
+        years = batch.dates.astype("datetime64[Y]").astype(int) + 1970
+        keep = years == year
 
+        # Filter marketplace
         if ignore_marketplace:
-            filtered_count = len(transactions) - len(filtered)
-            if filtered_count > 0:
-                warnings.append(f"Filtered out {filtered_count} marketplace transactions")
-
-        return filtered
+            keep &= batch.revenue_types != "marketplace"
+
+        # Filter negatives
+        if not include_negatives:
+            keep &= batch.amounts >= 0
+
+        # Validate state codes once per category, then broadcast to rows
+        cat_valid = batch.states.categories.isin(_VALID_STATES)
+        codes = batch.states.codes
+        valid_state = np.zeros(len(batch), dtype=bool)
+        observed = codes >= 0
+        valid_state[observed] = cat_valid[codes[observed]]
+
+        invalid = keep & ~valid_state
+        if invalid.any():
+            bad_codes = ", ".join(sorted(set(np.asarray(batch.states[invalid], dtype=str))))
+            warnings.append(
+                f"Filtered out transactions with invalid state codes: {bad_codes}"
+            )
+        keep &= valid_state
 
-    def _group_by_state(
-        self, transactions: List[Transaction]
-    ) -> dict[str, List[Transaction]]:
-        """Group transactions by state."""
-        by_state: dict[str, List[Transaction]] = {}
+        return batch.take(keep)
 
-        for txn in transactions:
-            if txn.state_code not in by_state:
-                by_state[txn.state_code] = []
-            by_state[txn.state_code].append(txn)
+    def _group_by_state(self, batch: TransactionBatch) -> dict[str, TransactionBatch]:
+        """Group a transaction batch by state in one vectorized pass.
 
-        return by_state
+        Sorts the whole batch once by (state, date, id), so each group is
+        a contiguous, date-ordered slice and _analyze_state never has to
+        sort again.
+        """
+        if len(batch) == 0:
+            return {}
+
+        # Sort on the integer category codes rather than the strings.
+        # One global gather puts every state's rows in a contiguous run;
+        # the per-state batches are then zero-copy views into it.
+        state_codes = batch.states.codes
+        order = np.lexsort((batch.ids, batch.dates, state_codes))
+        sorted_batch = batch.take(order)
+        codes_sorted = sorted_batch.states.codes
+
+        uniq = np.unique(codes_sorted)
+        starts = np.searchsorted(codes_sorted, uniq, side="left")
+        ends = np.append(starts[1:], len(order))
+
+        categories = batch.states.categories
+        return {
+            str(categories[code]): sorted_batch.slice(starts[i], ends[i])
+            for i, code in enumerate(uniq)
+        }
 
     def _analyze_state(
-        self, state_code: str, transactions: List[Transaction], rule: StateRule
+        self, state_code: str, batch: TransactionBatch, rule: StateRule, tax_rate: float
     ) -> StateResult:
-        """Analyze transactions for a single state."""
-        # Sort by date
-        sorted_txns = sorted(transactions, key=lambda t: (t.date, t.id))
-
-        # Calculate cumulative breach
-        total_revenue = 0.0
-        total_txns = 0
-        breach_idx = -1
-        breach_type = None
-
-        # No threshold = no breach possible (states without sales tax)
-        if rule.amount == 0:
-            total_revenue = sum(t.amount for t in sorted_txns)
-            total_txns = len(sorted_txns)
-        else:
-            for idx, txn in enumerate(sorted_txns):
-                total_revenue += txn.amount
-                total_txns += 1
-
-                # Check revenue threshold
-                if total_revenue >= rule.amount:
-                    breach_idx = idx
-                    breach_type = "revenue"
-                    break
-
-                # Check transaction threshold
-                if rule.transactions and total_txns >= rule.transactions:
-                    breach_idx = idx
-                    breach_type = "transactions"
-                    break
+        """Analyze a single state's transaction batch.
 
-        # Calculate threshold percentage
-        if rule.amount > 0:
-            revenue_pct = (total_revenue / rule.amount) * 100
-            txn_pct = 0.0
-            if rule.transactions and rule.transactions > 0:
-                txn_pct = (total_txns / rule.transactions) * 100
-            threshold_pct = max(revenue_pct, txn_pct)
-        else:
-            threshold_pct = 0.0
-
-        # Get tax rate
-        tax_rate = self.loader.get_tax_rate(state_code) or 0.0
-
-        # Calculate liability (simple estimate: total_revenue * tax_rate)
-        liability = 0.0
-        if breach_idx >= 0:
-            # Only liable for post-nexus revenue
-            post_nexus_revenue = sum(t.amount for t in sorted_txns[breach_idx:])
-            liability = post_nexus_revenue * (tax_rate / 100)
-
-        return StateResult(
-            state_code=state_code,
-            has_nexus=breach_idx >= 0,
-            total_revenue=total_revenue,
-            total_transactions=total_txns,
-            threshold_revenue=rule.amount,
-            threshold_transactions=rule.transactions,
-            breach_type=breach_type,
-            breach_date=sorted_txns[breach_idx].date if breach_idx >= 0 else None,
-            breach_transaction_id=sorted_txns[breach_idx].id if breach_idx >= 0 else None,
-            threshold_percentage=threshold_pct,
-            tax_rate=tax_rate,
-            estimated_liability=liability,
-        )
+        The batch must already be sorted by (date, id), as produced by
+        _group_by_state.
+        """
+        return _analyze_state_batch(state_code, batch, rule, tax_rate)
 
     def _is_valid_state_code(self, code: str) -> bool:
-        """Check if a state code is valid."""
-        return len(code) == 2 and code.isalpha()
+        """Check if a state code is a real jurisdiction code."""
+        return code in _VALID_STATES
 
     def _map_state_name(self, name: str) -> str:
         """Map full state name to 2-letter code."""
-        mapping = {
-            "ALABAMA": "AL",
-            "ALASKA": "AK",
-            "ARIZONA": "AZ",
-            "ARKANSAS": "AR",
-            "CALIFORNIA": "CA",
-            "COLORADO": "CO",
-            "CONNECTICUT": "CT",
-            "DELAWARE": "DE",
-            "FLORIDA": "FL",
-            "GEORGIA": "GA",
-            "HAWAII": "HI",
-            "IDAHO": "ID",
-            "ILLINOIS": "IL",
-            "INDIANA": "IN",
-            "IOWA": "IA",
-            "KANSAS": "KS",
-            "KENTUCKY": "KY",
-            "LOUISIANA": "LA",
-            "MAINE": "ME",
-            "MARYLAND": "MD",
-            "MASSACHUSETTS": "MA",
-            "MICHIGAN": "MI",
-            "MINNESOTA": "MN",
-            "MISSISSIPPI": "MS",
-            "MISSOURI": "MO",
-            "MONTANA": "MT",
-            "NEBRASKA": "NE",
-            "NEVADA": "NV",
-            "NEW HAMPSHIRE": "NH",
-            "NEW JERSEY": "NJ",
-            "NEW MEXICO": "NM",
-            "NEW YORK": "NY",
-            "NORTH CAROLINA": "NC",
-            "NORTH DAKOTA": "ND",
-            "OHIO": "OH",
-            "OKLAHOMA": "OK",
-            "OREGON": "OR",
-            "PENNSYLVANIA": "PA",
-            "RHODE ISLAND": "RI",
-            "SOUTH CAROLINA": "SC",
-            "SOUTH DAKOTA": "SD",
-            "TENNESSEE": "TN",
-            "TEXAS": "TX",
-            "UTAH": "UT",
-            "VERMONT": "VT",
-            "VIRGINIA": "VA",
-            "WASHINGTON": "WA",
-            "WEST VIRGINIA": "WV",
-            "WISCONSIN": "WI",
-            "WYOMING": "WY",
-            "DISTRICT OF COLUMBIA": "DC",
-        }
-        return mapping.get(name.upper(), name[:2])
+        return _STATE_NAME_TO_CODE.get(name.upper(), name[:2])
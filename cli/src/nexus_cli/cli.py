@@ -11,12 +11,15 @@ from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from typing import Optional
 
-from .config_loader import get_loader
-from .analyzer import NexusAnalyzer
-
+# The analyzer and config loader pull in pandas and pydantic, which dominate
+# CLI cold-start; they are imported inside the commands that need them so
+# `nexus --help` stays fast.
 
 console = Console()
 
+# Files larger than this are streamed in chunks instead of loaded at once
+STREAM_THRESHOLD_BYTES = 256 * 1024 * 1024
+
 
 @click.group()
 @click.version_option(version="1.0.0")
@@ -53,12 +56,18 @@ def main() -> None:
     is_flag=True,
     help="Include negative amounts (returns/refunds)",
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Skip the Parquet sidecar cache and always re-parse the CSV",
+)
 def analyze(
     csv_file: Path,
     output: Optional[Path],
     year: Optional[int],
     ignore_marketplace: bool,
     include_negatives: bool,
+    no_cache: bool,
 ) -> None:
     """Analyze a CSV file for nexus obligations.
 
@@ -76,6 +85,8 @@ def analyze(
       - transaction_count: Number of transactions (default: 1)
       - revenue_type: 'taxable', 'nontaxable', or 'marketplace'
     """
+    from .analyzer import NexusAnalyzer
+
     console.print(f"\n[bold blue]Nexus Analysis[/bold blue]")
     console.print(f"Input file: {csv_file}")
 
@@ -95,18 +106,32 @@ def analyze(
         task = progress.add_task("Loading CSV file...", total=None)
 
         try:
-            # Load CSV
-            transactions = analyzer.load_csv(csv_file)
-            progress.update(task, description=f"Loaded {len(transactions):,} transactions")
-
-            # Analyze
-            progress.update(task, description="Analyzing nexus...")
-            results = analyzer.analyze(
-                transactions=transactions,
-                year=year,
-                ignore_marketplace=ignore_marketplace,
-                include_negatives=include_negatives,
-            )
+            if csv_file.stat().st_size > STREAM_THRESHOLD_BYTES:
+                # Stream large files chunk by chunk to bound memory
+                progress.update(task, description="Analyzing nexus (streaming)...")
+                results = analyzer.analyze_stream(
+                    analyzer.iter_csv(csv_file, year=year),
+                    year=year,
+                    ignore_marketplace=ignore_marketplace,
+                    include_negatives=include_negatives,
+                )
+            else:
+                # Load CSV
+                transactions = analyzer.load_csv(
+                    csv_file, use_cache=not no_cache, year=year
+                )
+                progress.update(
+                    task, description=f"Loaded {len(transactions):,} transactions"
+                )
+
+                # Analyze
+                progress.update(task, description="Analyzing nexus...")
+                results = analyzer.analyze(
+                    transactions=transactions,
+                    year=year,
+                    ignore_marketplace=ignore_marketplace,
+                    include_negatives=include_negatives,
+                )
 
             progress.update(task, description="Generating report...")
 
@@ -160,6 +185,8 @@ def analyze(
 @main.command()
 def states() -> None:
     """List all state nexus rules."""
+    from .config_loader import get_loader
+
     loader = get_loader()
     config = loader.load_state_rules()
 
@@ -200,6 +227,8 @@ def state_info(state_code: str) -> None:
 
     STATE_CODE: 2-letter state code (e.g., CA, NY)
     """
+    from .config_loader import get_loader
+
     state_code = state_code.upper()
     loader = get_loader()
 
@@ -244,6 +273,8 @@ def state_info(state_code: str) -> None:
 @main.command()
 def config_info() -> None:
     """Show information about the loaded configuration."""
+    from .config_loader import get_loader
+
     loader = get_loader()
 
     console.print(f"\n[bold]Configuration Information[/bold]\n")
@@ -4,11 +4,64 @@ Loads YAML configuration files from the shared/config directory.
 This ensures both the web app and CLI use the same configuration.
 """
 
+import os
+import sys
 import yaml
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
-from pydantic import BaseModel, Field, validator
+from typing import Annotated, Callable, Dict, List, Optional, Union
+from pydantic import (
+    BaseModel,
+    Field,
+    PrivateAttr,
+    StringConstraints,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
+
+# Prefer the libyaml C loader when PyYAML was built with it; it parses the
+# same safe subset of YAML several times faster than the pure-Python loader.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Shared constrained-string types so every model field reuses one pattern
+# instead of carrying its own copy.
+RuleId = Annotated[str, StringConstraints(pattern=r"^[A-Z]{2}-\d{4}-\d{2}$")]
+Version = Annotated[str, StringConstraints(pattern=r"^\d+\.\d+\.\d+$")]
+
+# Validated configs are mirrored to disk as JSON so warm startups can skip
+# the YAML parse entirely. orjson is optional; stdlib json is the fallback.
+try:
+    import orjson
+
+    def _json_dumps(obj: dict) -> bytes:
+        return orjson.dumps(obj)
+
+    def _json_loads(data: bytes) -> dict:
+        return orjson.loads(data)
+
+except ImportError:
+    import json
+
+    def _json_dumps(obj: dict) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    def _json_loads(data: bytes) -> dict:
+        return json.loads(data)
+
+
+_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "nexus_cli"
+
+# The 50 states plus DC. Lookups check membership here before touching the
+# config so unknown codes never trigger a load, and the analyzer reuses this
+# set for transaction validation.
+US_STATES = frozenset({
+    "AK", "AL", "AR", "AZ", "CA", "CO", "CT", "DC", "DE", "FL", "GA", "HI", "IA",
+    "ID", "IL", "IN", "KS", "KY", "LA", "MA", "MD", "ME", "MI", "MN", "MO", "MS",
+    "MT", "NC", "ND", "NE", "NH", "NJ", "NM", "NV", "NY", "OH", "OK", "OR", "PA",
+    "RI", "SC", "SD", "TN", "TX", "UT", "VA", "VT", "WA", "WI", "WV", "WY",
+})
 
 
 class StateRule(BaseModel):
@@ -19,13 +72,17 @@ class StateRule(BaseModel):
     transactions: Optional[int] = Field(None, ge=1, description="Transaction count threshold")
     effective_date: date
     end_date: Optional[date] = None
-    rule_id: str = Field(pattern=r"^[A-Z]{2}-\d{4}-\d{2}$")
+    rule_id: RuleId
     notes: Optional[str] = None
 
-    @validator("end_date")
-    def end_date_must_be_after_effective(cls, v: Optional[date], values: dict) -> Optional[date]:
+    @field_validator("end_date")
+    @classmethod
+    def end_date_must_be_after_effective(
+        cls, v: Optional[date], info: ValidationInfo
+    ) -> Optional[date]:
         """Validate that end_date is after effective_date."""
-        if v and "effective_date" in values and v <= values["effective_date"]:
+        effective_date = info.data.get("effective_date")
+        if v and effective_date and v <= effective_date:
             raise ValueError("end_date must be after effective_date")
         return v
 
@@ -34,7 +91,9 @@ class TaxRateInfo(BaseModel):
     """Tax rate information for a state."""
 
     state_rate: float = Field(ge=0, le=100)
-    avg_local_rate: float = Field(ge=0, le=100)
+    # Can be slightly negative: NJ's Salem County reduced rate pulls the
+    # statewide average local rate below zero in the Tax Foundation data.
+    avg_local_rate: float = Field(ge=-100, le=100)
     combined_rate: float = Field(ge=0, le=100)
     max_local_rate: float = Field(ge=0, le=100)
     notes: Optional[str] = None
@@ -43,33 +102,137 @@ class TaxRateInfo(BaseModel):
 class StateRulesConfig(BaseModel):
     """Complete state rules configuration."""
 
-    version: str = Field(pattern=r"^\d+\.\d+\.\d+$")
+    version: Version
     last_updated: date
     source: str
     states: Dict[str, StateRule]
     historical_rules: Optional[Dict[str, StateRule]] = None
 
-    @validator("states")
-    def validate_state_codes(cls, v: Dict[str, StateRule]) -> Dict[str, StateRule]:
+    # Current (non-expired) rules by state code, prefiltered once at load
+    # time so per-state lookups are a plain dict access.
+    _current_by_state: Dict[str, StateRule] = PrivateAttr(default_factory=dict)
+
+    @model_validator(mode="before")
+    @classmethod
+    def inject_state_codes(cls, data: dict) -> dict:
+        """Copy each states key into its rule's state_code before validation."""
+        if isinstance(data, dict):
+            for state_code, rule_data in (data.get("states") or {}).items():
+                if isinstance(rule_data, dict):
+                    rule_data.setdefault("state_code", state_code)
+        return data
+
+    @model_validator(mode="after")
+    def validate_state_codes(self) -> "StateRulesConfig":
         """Validate that state codes match the keys."""
-        for state_code, rule in v.items():
+        for state_code, rule in self.states.items():
             if rule.state_code != state_code:
                 raise ValueError(
                     f"State code mismatch: key is {state_code} but rule.state_code is {rule.state_code}"
                 )
-        return v
+        return self
 
 
 class TaxRatesConfig(BaseModel):
     """Complete tax rates configuration."""
 
-    version: str = Field(pattern=r"^\d+\.\d+\.\d+$")
+    version: Version
     last_updated: date
     source: str
     source_url: Optional[str] = None
     rates: Dict[str, TaxRateInfo]
 
 
+def _disk_cache_path(path: str, mtime_ns: int) -> Path:
+    """Cache file for a config; the mtime in the name handles invalidation."""
+    return _CACHE_DIR / f"{Path(path).name}.{mtime_ns}.json"
+
+
+def _read_disk_cache(path: str, mtime_ns: int) -> Optional[dict]:
+    """Return the cached raw config dict, or None on any miss/problem."""
+    try:
+        return _json_loads(_disk_cache_path(path, mtime_ns).read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_disk_cache(path: str, mtime_ns: int, data: dict) -> None:
+    """Best-effort write; prunes stale entries for the same config file."""
+    cache_file = _disk_cache_path(path, mtime_ns)
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for stale in _CACHE_DIR.glob(f"{Path(path).name}.*.json"):
+            if stale != cache_file:
+                stale.unlink(missing_ok=True)
+        cache_file.write_bytes(_json_dumps(data))
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=4)
+def _load_state_rules_cached(path: str, mtime_ns: int) -> StateRulesConfig:
+    """Parse and validate state_rules.yaml.
+
+    Memoized on (path, mtime_ns) so repeat lookups within a process reuse
+    the already-validated config instead of re-reading and re-parsing it.
+    """
+    # Warm starts read the JSON mirror of the last validated config; the
+    # YAML pipeline only runs when the mirror is missing or stale.
+    raw_config = _read_disk_cache(path, mtime_ns)
+    from_disk_cache = raw_config is not None
+
+    if raw_config is None:
+        # The YAML loader resolves YYYY-MM-DD scalars to date objects, and
+        # Pydantic's date fields coerce any that arrive as strings, so no
+        # separate conversion pass is needed.
+        with open(path, "rb") as f:
+            raw_config = yaml.load(f, Loader=_YamlLoader)
+
+    # Validate in a single pydantic-core pass; state_code injection happens
+    # in StateRulesConfig's before-validator rather than a Python-level loop
+    try:
+        config = StateRulesConfig.model_validate(raw_config)
+
+    except Exception as e:
+        raise ValueError(f"Invalid state rules configuration: {e}") from e
+
+    if not from_disk_cache:
+        _write_disk_cache(path, mtime_ns, config.model_dump(mode="json"))
+
+    # Prefilter expired rules once so lookups don't repeat the date compare.
+    # Interned keys let later dict lookups hit the identity fast path.
+    today = date.today()
+    config._current_by_state = {
+        sys.intern(code): rule
+        for code, rule in config.states.items()
+        if rule.end_date is None or rule.end_date > today
+    }
+    return config
+
+
+@lru_cache(maxsize=4)
+def _load_tax_rates_cached(path: str, mtime_ns: int) -> TaxRatesConfig:
+    """Parse and validate tax_rates.yaml, memoized on (path, mtime_ns)."""
+    raw_config = _read_disk_cache(path, mtime_ns)
+    from_disk_cache = raw_config is not None
+
+    if raw_config is None:
+        with open(path, "rb") as f:
+            raw_config = yaml.load(f, Loader=_YamlLoader)
+
+    # Validate in a single pydantic-core pass
+    try:
+        config = TaxRatesConfig.model_validate(raw_config)
+
+    except Exception as e:
+        raise ValueError(f"Invalid tax rates configuration: {e}") from e
+
+    if not from_disk_cache:
+        _write_disk_cache(path, mtime_ns, config.model_dump(mode="json"))
+
+    return config
+
+
 class ConfigLoader:
     """Loads and validates YAML configuration files."""
 
@@ -94,6 +257,11 @@ class ConfigLoader:
                 "Make sure you're running from the project root."
             )
 
+        # Join the config paths once; the loaders are called per lookup and
+        # pathlib joins are not free
+        self._state_rules_path = self.config_dir / "state_rules.yaml"
+        self._tax_rates_path = self.config_dir / "tax_rates.yaml"
+
     def load_state_rules(self) -> StateRulesConfig:
         """Load state nexus rules from YAML.
 
@@ -104,39 +272,14 @@ class ConfigLoader:
             FileNotFoundError: If state_rules.yaml doesn't exist.
             ValueError: If the YAML is invalid or doesn't match the schema.
         """
-        rules_file = self.config_dir / "state_rules.yaml"
-
-        if not rules_file.exists():
-            raise FileNotFoundError(f"State rules file not found: {rules_file}")
-
-        with open(rules_file, "r") as f:
-            raw_config = yaml.safe_load(f)
+        rules_file = self._state_rules_path
 
-        # Convert string dates to date objects in the raw config
-        raw_config = self._convert_dates(raw_config)
-
-        # Parse and validate with Pydantic
         try:
-            # Parse state rules
-            states = {}
-            for state_code, rule_data in raw_config.get("states", {}).items():
-                rule_data["state_code"] = state_code
-                states[state_code] = StateRule(**rule_data)
-
-            raw_config["states"] = states
-
-            # Parse historical rules if present
-            if "historical_rules" in raw_config and raw_config["historical_rules"]:
-                historical = {}
-                for rule_id, rule_data in raw_config["historical_rules"].items():
-                    historical[rule_id] = StateRule(**rule_data)
-                raw_config["historical_rules"] = historical
-
-            config = StateRulesConfig(**raw_config)
-            return config
+            mtime_ns = os.stat(rules_file).st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"State rules file not found: {rules_file}")
 
-        except Exception as e:
-            raise ValueError(f"Invalid state rules configuration: {e}") from e
+        return _load_state_rules_cached(str(rules_file), mtime_ns)
 
     def load_tax_rates(self) -> TaxRatesConfig:
         """Load tax rates from YAML.
@@ -148,30 +291,63 @@ class ConfigLoader:
             FileNotFoundError: If tax_rates.yaml doesn't exist.
             ValueError: If the YAML is invalid or doesn't match the schema.
         """
-        rates_file = self.config_dir / "tax_rates.yaml"
+        rates_file = self._tax_rates_path
 
-        if not rates_file.exists():
+        try:
+            mtime_ns = os.stat(rates_file).st_mtime_ns
+        except FileNotFoundError:
             raise FileNotFoundError(f"Tax rates file not found: {rates_file}")
 
-        with open(rates_file, "r") as f:
-            raw_config = yaml.safe_load(f)
+        return _load_tax_rates_cached(str(rates_file), mtime_ns)
 
-        # Convert string dates to date objects
-        raw_config = self._convert_dates(raw_config)
+    def load_state_rules_header(self) -> dict:
+        """Read only the metadata header of state_rules.yaml.
 
-        # Parse and validate with Pydantic
-        try:
-            rates = {}
-            for state_code, rate_data in raw_config.get("rates", {}).items():
-                rates[state_code] = TaxRateInfo(**rate_data)
+        Version and freshness probes don't need the full states mapping,
+        so this parses just the bytes before the ``states:`` key. Falls
+        back to a full load if the shortcut can't be parsed.
 
-            raw_config["rates"] = rates
+        Returns:
+            Dict with at least 'version', 'last_updated', and 'source'.
+        """
+        return self._load_header(self._state_rules_path, b"\nstates:", self.load_state_rules)
 
-            config = TaxRatesConfig(**raw_config)
-            return config
+    def load_tax_rates_header(self) -> dict:
+        """Read only the metadata header of tax_rates.yaml.
 
-        except Exception as e:
-            raise ValueError(f"Invalid tax rates configuration: {e}") from e
+        Returns:
+            Dict with at least 'version', 'last_updated', and 'source'.
+        """
+        return self._load_header(self._tax_rates_path, b"\nrates:", self.load_tax_rates)
+
+    @staticmethod
+    def _load_header(
+        path: Path,
+        body_key: bytes,
+        fallback: Callable[[], Union["StateRulesConfig", "TaxRatesConfig"]],
+    ) -> dict:
+        """Parse the YAML preceding body_key, falling back to a full load."""
+        try:
+            with open(path, "rb") as f:
+                head = f.read(4096)
+            head = head.split(body_key, 1)[0]
+            header = yaml.load(head, Loader=_YamlLoader)
+            if isinstance(header, dict) and "version" in header:
+                # The full load yields last_updated as a date; coerce the
+                # raw header the same way so callers see one type
+                last_updated = header.get("last_updated")
+                if isinstance(last_updated, str):
+                    header["last_updated"] = date.fromisoformat(last_updated)
+                return header
+        except (OSError, ValueError, yaml.YAMLError):
+            pass
+
+        config = fallback()
+        return {
+            "version": config.version,
+            "last_updated": config.last_updated,
+            "source": config.source,
+        }
 
     def get_current_rules(self) -> List[StateRule]:
         """Get all current (non-expired) state rules.
@@ -179,15 +355,7 @@ class ConfigLoader:
         Returns:
             List of StateRule objects with no end_date or future end_date.
         """
-        config = self.load_state_rules()
-        today = date.today()
-
-        current_rules = []
-        for rule in config.states.values():
-            if rule.end_date is None or rule.end_date > today:
-                current_rules.append(rule)
-
-        return current_rules
+        return list(self.load_state_rules()._current_by_state.values())
 
     def get_rule_for_state(self, state_code: str) -> Optional[StateRule]:
         """Get the current rule for a specific state.
@@ -198,20 +366,11 @@ class ConfigLoader:
         Returns:
             StateRule if found, None otherwise.
         """
-        config = self.load_state_rules()
         state_code = state_code.upper()
-
-        if state_code not in config.states:
-            return None
-
-        rule = config.states[state_code]
-
-        # Check if rule is still current
-        today = date.today()
-        if rule.end_date and rule.end_date <= today:
+        if state_code not in US_STATES:
             return None
 
-        return rule
+        return self.load_state_rules()._current_by_state.get(state_code)
 
     def get_tax_rate(self, state_code: str) -> Optional[float]:
         """Get the combined tax rate for a state.
@@ -222,44 +381,25 @@ class ConfigLoader:
         Returns:
             Combined tax rate as a percentage, or None if not found.
         """
-        config = self.load_tax_rates()
         state_code = state_code.upper()
+        if state_code not in US_STATES:
+            return None
+
+        config = self.load_tax_rates()
 
         if state_code not in config.rates:
             return None
 
         return config.rates[state_code].combined_rate
 
-    def _convert_dates(self, config: dict) -> dict:
-        """Recursively convert date strings to date objects.
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop the memoized configs, forcing the next load to re-parse.
 
-        Args:
-            config: Dictionary that may contain date strings
-
-        Returns:
-            Dictionary with date strings converted to date objects
+        Mainly useful in tests that rewrite config files in place.
         """
-        if not isinstance(config, dict):
-            return config
-
-        converted = {}
-        for key, value in config.items():
-            if key in ("effective_date", "end_date", "last_updated"):
-                if isinstance(value, str):
-                    try:
-                        # Parse YYYY-MM-DD format
-                        year, month, day = map(int, value.split("-"))
-                        converted[key] = date(year, month, day)
-                    except (ValueError, AttributeError):
-                        converted[key] = value
-                else:
-                    converted[key] = value
-            elif isinstance(value, dict):
-                converted[key] = self._convert_dates(value)
-            else:
-                converted[key] = value
-
-        return converted
+        _load_state_rules_cached.cache_clear()
+        _load_tax_rates_cached.cache_clear()
 
 
 # Singleton instance
@@ -5,31 +5,52 @@ to ensure the Python implementation produces identical results to
 the TypeScript implementation.
 """
 
+import functools
+import os
+
 import pytest
 import yaml
 from pathlib import Path
-from datetime import datetime
+from datetime import date
+
+from nexus_cli.analyzer import _HAVE_PARQUET, NexusAnalyzer, Transaction
 
-from nexus_cli.analyzer import NexusAnalyzer, Transaction
+# Use the libyaml C loader when available (same safe subset, much faster)
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
+@functools.lru_cache(maxsize=1)
 def load_test_cases():
-    """Load shared test cases from YAML."""
+    """Load shared test cases from YAML (parsed once per session)."""
     test_file = Path(__file__).parent.parent.parent / "shared" / "tests" / "test_cases.yaml"
 
     if not test_file.exists():
         pytest.skip(f"Test cases file not found: {test_file}")
 
-    with open(test_file) as f:
-        data = yaml.safe_load(f)
+    with open(test_file, "rb") as f:
+        data = yaml.load(f, Loader=_YamlLoader)
 
     return data.get("test_cases", [])
 
 
+@pytest.fixture(scope="session")
+def analyzer():
+    """Shared NexusAnalyzer so parametrized cases reuse one config load."""
+    return NexusAnalyzer()
+
+
+@pytest.fixture(scope="session")
+def loader():
+    """Shared ConfigLoader so tests reuse one validated config set."""
+    from nexus_cli.config_loader import get_loader
+
+    return get_loader()
+
+
 def parse_transaction(txn_dict):
     """Parse a transaction dict from YAML into a Transaction object."""
     date_str = txn_dict["date"]
-    date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
+    date_obj = date.fromisoformat(date_str)
 
     return Transaction(
         id=txn_dict["id"],
@@ -40,15 +61,41 @@ def parse_transaction(txn_dict):
     )
 
 
+def _bulk_parse_transactions(txns):
+    """Vectorized variant of parse_transaction for large fixture cases.
+
+    Parses all dates in one numpy datetime64 conversion instead of one
+    Python-level call per row; only worthwhile above ~100 transactions.
+    """
+    import numpy as np
+
+    dates = np.array([t["date"] for t in txns], dtype="datetime64[D]").astype(object)
+
+    return [
+        Transaction(
+            id=t["id"],
+            state_code=t["state_code"],
+            amount=t["amount"],
+            date=d,
+            revenue_type=t.get("revenue_type"),
+        )
+        for t, d in zip(txns, dates)
+    ]
+
+
 @pytest.mark.parametrize("test_case", load_test_cases(), ids=lambda tc: tc["name"])
-def test_parity(test_case):
+def test_parity(test_case, analyzer):
     """Test that Python implementation matches expected results from shared test cases."""
     # Skip performance tests
     if "generate" in test_case:
         pytest.skip("Performance test - run separately")
 
-    # Parse transactions
-    transactions = [parse_transaction(t) for t in test_case["transactions"]]
+    # Parse transactions (bulk path for the large generated cases)
+    raw_txns = test_case["transactions"]
+    if len(raw_txns) > 100:
+        transactions = _bulk_parse_transactions(raw_txns)
+    else:
+        transactions = [parse_transaction(t) for t in raw_txns]
 
     # Parse options
     options = test_case["options"]
@@ -59,8 +106,6 @@ def test_parity(test_case):
     include_negatives = options.get("includeNegativeAmounts", False)
 
     # Analyze
-    analyzer = NexusAnalyzer()
-
     if mode == "singleYear":
         result = analyzer.analyze(
             transactions=transactions,
@@ -84,75 +129,65 @@ def test_parity(test_case):
     # Check expected results
     expected = test_case["expected"]
 
-    # Check warnings
+    # Check warnings: one C-level substring search against the joined
+    # warnings instead of a Python loop per expected warning
     if "warnings" in expected:
+        warnings_blob = "\n".join(result.warnings)
         for warning in expected["warnings"]:
-            assert any(
-                warning in w for w in result.warnings
-            ), f"Expected warning not found: {warning}"
+            assert warning in warnings_blob, f"Expected warning not found: {warning}"
 
-    # Check state results
-    if "states" in expected:
-        for state_code, expected_state in expected["states"].items():
-            # Find state in results
-            state_result = next(
-                (r for r in result.state_results if r.state_code == state_code), None
-            )
+    # Check state results. Comparisons use pytest.fail so the message
+    # f-strings only get built on an actual mismatch.
+    expected_states = tuple(expected.get("states", {}).items())
+    if expected_states:
+        # Index results once; O(1) lookups instead of a scan per expected state
+        state_result_by_code = {r.state_code: r for r in result.state_results}
 
-            assert state_result is not None, f"State {state_code} not found in results"
+        for state_code, expected_state in expected_states:
+            state_result = state_result_by_code.get(state_code)
+
+            if state_result is None:
+                pytest.fail(f"State {state_code} not found in results")
 
             # Check exceeded
             if "exceeded" in expected_state:
-                assert (
-                    state_result.has_nexus == expected_state["exceeded"]
-                ), f"{state_code}: exceeded mismatch"
+                if state_result.has_nexus != expected_state["exceeded"]:
+                    pytest.fail(f"{state_code}: exceeded mismatch")
 
             # Check breach type
             if "breach_type" in expected_state:
-                assert (
-                    state_result.breach_type == expected_state["breach_type"]
-                ), f"{state_code}: breach_type mismatch"
+                if state_result.breach_type != expected_state["breach_type"]:
+                    pytest.fail(f"{state_code}: breach_type mismatch")
 
             # Check breach date
             if "breach_date" in expected_state and expected_state["breach_date"]:
-                expected_date = datetime.strptime(
-                    expected_state["breach_date"], "%Y-%m-%d"
-                ).date()
-                assert (
-                    state_result.breach_date == expected_date
-                ), f"{state_code}: breach_date mismatch"
+                expected_date = date.fromisoformat(expected_state["breach_date"])
+                if state_result.breach_date != expected_date:
+                    pytest.fail(f"{state_code}: breach_date mismatch")
 
             # Check total revenue (with tolerance for floating point)
             if "total_revenue" in expected_state:
-                assert abs(state_result.total_revenue - expected_state["total_revenue"]) < 0.01, \
-                    f"{state_code}: total_revenue mismatch"
+                if abs(state_result.total_revenue - expected_state["total_revenue"]) >= 0.01:
+                    pytest.fail(f"{state_code}: total_revenue mismatch")
 
             # Check total transactions
             if "total_transactions" in expected_state:
-                assert (
-                    state_result.total_transactions == expected_state["total_transactions"]
-                ), f"{state_code}: total_transactions mismatch"
+                if state_result.total_transactions != expected_state["total_transactions"]:
+                    pytest.fail(f"{state_code}: total_transactions mismatch")
 
             # Check threshold revenue
             if "threshold_revenue" in expected_state:
-                assert abs(
-                    state_result.threshold_revenue - expected_state["threshold_revenue"]
-                ) < 0.01, f"{state_code}: threshold_revenue mismatch"
+                if abs(state_result.threshold_revenue - expected_state["threshold_revenue"]) >= 0.01:
+                    pytest.fail(f"{state_code}: threshold_revenue mismatch")
 
             # Check breach transaction ID
             if "breach_transaction_id" in expected_state:
-                assert (
-                    state_result.breach_transaction_id
-                    == expected_state["breach_transaction_id"]
-                ), f"{state_code}: breach_transaction_id mismatch"
+                if state_result.breach_transaction_id != expected_state["breach_transaction_id"]:
+                    pytest.fail(f"{state_code}: breach_transaction_id mismatch")
 
 
-def test_config_loading():
+def test_config_loading(loader):
     """Test that configuration loads successfully."""
-    from nexus_cli.config_loader import get_loader
-
-    loader = get_loader()
-
     # Load state rules
     rules_config = loader.load_state_rules()
     assert rules_config.version is not None
@@ -174,17 +209,31 @@ def test_config_loading():
     assert ca_rate > 0
 
 
-def test_analyzer_basic():
-    """Basic test of analyzer functionality."""
-    analyzer = NexusAnalyzer()
+def test_config_header_probes(loader):
+    """Header-only probes must agree with the fully validated configs."""
+    rules_header = loader.load_state_rules_header()
+    rules_config = loader.load_state_rules()
+    assert rules_header["version"] == rules_config.version
+    assert rules_header["last_updated"] == rules_config.last_updated
+    assert rules_header["source"] == rules_config.source
+    assert "states" not in rules_header
 
+    rates_header = loader.load_tax_rates_header()
+    rates_config = loader.load_tax_rates()
+    assert rates_header["version"] == rates_config.version
+    assert rates_header["last_updated"] == rates_config.last_updated
+    assert "rates" not in rates_header
+
+
+def test_analyzer_basic(analyzer):
+    """Basic test of analyzer functionality."""
     # Create simple test transactions
     transactions = [
         Transaction(
             id="tx-1",
             state_code="CA",
             amount=600000,
-            date=datetime(2024, 6, 15).date(),
+            date=date(2024, 6, 15),
         ),
     ]
 
@@ -202,7 +251,7 @@ def test_analyzer_basic():
     assert ca_result.total_revenue == 600000
 
 
-def test_csv_loading(tmp_path):
+def test_csv_loading(tmp_path, analyzer):
     """Test CSV file loading."""
     # Create a test CSV file
     csv_content = """date,state,amount
@@ -215,7 +264,6 @@ def test_csv_loading(tmp_path):
     csv_file.write_text(csv_content)
 
     # Load CSV
-    analyzer = NexusAnalyzer()
     transactions = analyzer.load_csv(csv_file)
 
     # Check loaded transactions
@@ -226,7 +274,7 @@ def test_csv_loading(tmp_path):
     assert transactions[2].state_code == "TX"
 
 
-def test_csv_column_mapping(tmp_path):
+def test_csv_column_mapping(tmp_path, analyzer):
     """Test that alternative column names are recognized."""
     # Create CSV with alternative column names
     csv_content = """transaction_date,State,sale_amount
@@ -238,7 +286,6 @@ def test_csv_column_mapping(tmp_path):
     csv_file.write_text(csv_content)
 
     # Load CSV
-    analyzer = NexusAnalyzer()
     transactions = analyzer.load_csv(csv_file)
 
     # Should successfully map columns
@@ -246,10 +293,76 @@ def test_csv_column_mapping(tmp_path):
     assert transactions[0].state_code == "CA"
 
 
-def test_state_name_mapping():
-    """Test that full state names are mapped to codes."""
-    analyzer = NexusAnalyzer()
+@pytest.mark.skipif(not _HAVE_PARQUET, reason="pyarrow not installed")
+def test_parquet_sidecar_cache(tmp_path, analyzer):
+    """load_csv writes a Parquet sidecar and serves repeat loads from it."""
+    csv_file = tmp_path / "test.csv"
+    csv_file.write_text(
+        "date,state,amount\n"
+        "2024-01-15,CA,100000\n"
+        "2024-02-20,NY,200000\n"
+        "2024-03-10,TX,150000\n"
+    )
+    sidecar = csv_file.with_suffix(".parquet")
+
+    # First load parses the CSV and writes the sidecar
+    assert len(analyzer.load_csv(csv_file)) == 3
+    assert sidecar.exists()
+
+    # With a newer sidecar, the CSV is not re-read: shrink it to one row
+    # but keep its mtime older than the sidecar's
+    csv_file.write_text("date,state,amount\n2024-01-15,CA,100000\n")
+    os.utime(csv_file, (sidecar.stat().st_mtime - 10,) * 2)
+    assert len(analyzer.load_csv(csv_file)) == 3
+
+    # use_cache=False bypasses the sidecar and re-parses the CSV
+    assert len(analyzer.load_csv(csv_file, use_cache=False)) == 1
+
+    # A CSV newer than the sidecar invalidates it and refreshes the cache
+    import pandas as pd
+
+    os.utime(csv_file, (sidecar.stat().st_mtime + 10,) * 2)
+    assert len(analyzer.load_csv(csv_file)) == 1
+    assert len(pd.read_parquet(sidecar)) == 1
 
+
+def test_analyze_stream_matches_analyze(tmp_path, analyzer):
+    """Streaming analysis must match the in-memory path on the same file."""
+    rows = ["date,state,amount"]
+    for i in range(30):
+        state = ("CA", "NY", "TX")[i % 3]
+        rows.append(f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d},{state},{(i + 1) * 25000}")
+
+    csv_file = tmp_path / "stream.csv"
+    csv_file.write_text("\n".join(rows) + "\n")
+
+    transactions = analyzer.load_csv(csv_file, use_cache=False)
+    expected = analyzer.analyze(transactions=transactions, year=2024)
+
+    # A small chunksize forces several chunks through the merge path
+    streamed = analyzer.analyze_stream(
+        analyzer.iter_csv(csv_file, chunksize=7), year=2024
+    )
+
+    assert streamed.transaction_count == expected.transaction_count
+    assert abs(streamed.total_liability - expected.total_liability) < 0.01
+
+    expected_by_code = {r.state_code: r for r in expected.state_results}
+    streamed_by_code = {r.state_code: r for r in streamed.state_results}
+    assert streamed_by_code.keys() == expected_by_code.keys()
+
+    for state_code, exp in expected_by_code.items():
+        got = streamed_by_code[state_code]
+        assert got.has_nexus == exp.has_nexus, state_code
+        assert got.breach_type == exp.breach_type, state_code
+        assert got.breach_date == exp.breach_date, state_code
+        assert got.breach_transaction_id == exp.breach_transaction_id, state_code
+        assert got.total_transactions == exp.total_transactions, state_code
+        assert abs(got.total_revenue - exp.total_revenue) < 0.01, state_code
+
+
+def test_state_name_mapping(analyzer):
+    """Test that full state names are mapped to codes."""
     # Test some mappings
     assert analyzer._map_state_name("CALIFORNIA") == "CA"
     assert analyzer._map_state_name("NEW YORK") == "NY"